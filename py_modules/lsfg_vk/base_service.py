@@ -5,7 +5,7 @@ Base service class with common functionality.
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Optional, TypeVar, Dict
+from typing import Any, Optional, TypeVar, Dict, Tuple
 
 from .constants import LOCAL_LIB, LOCAL_SHARE_BASE, VULKAN_LAYER_DIR, SCRIPT_NAME, CONFIG_DIR, CONFIG_FILENAME
 
@@ -36,14 +36,24 @@ class BaseService:
         self.lsfg_launch_script_path = self.user_home / SCRIPT_NAME  # ~/lsfg launch script
         self.config_dir = self.user_home / CONFIG_DIR
         self.config_file_path = self.config_dir / CONFIG_FILENAME
+        
+        # Whether config_dir is known to exist, so it's only created once per instance
+        self._config_dir_ready = False
     
     def _ensure_directories(self) -> None:
         """Create necessary directories if they don't exist"""
         self.local_lib_dir.mkdir(parents=True, exist_ok=True)
         self.local_share_dir.mkdir(parents=True, exist_ok=True)
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._config_dir_ready = True
         self.log.info(f"Ensured directories exist: {self.local_lib_dir}, {self.local_share_dir}, {self.config_dir}")
     
+    def _ensure_config_dir(self) -> None:
+        """Create the config directory if it doesn't exist, only checking once per instance"""
+        if not self._config_dir_ready:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._config_dir_ready = True
+    
     def _remove_if_exists(self, path: Path) -> bool:
         """Remove a file if it exists
         
@@ -56,44 +66,104 @@ class BaseService:
         Raises:
             OSError: If removal fails
         """
-        if path.exists():
-            try:
-                path.unlink()
-                self.log.info(f"Removed {path}")
-                return True
-            except OSError as e:
-                self.log.error(f"Failed to remove {path}: {e}")
-                raise
-        else:
+        try:
+            path.unlink()
+        except FileNotFoundError:
             self.log.info(f"File not found: {path}")
             return False
+        except OSError as e:
+            self.log.error(f"Failed to remove {path}: {e}")
+            raise
+        
+        self.log.info(f"Removed {path}")
+        return True
     
-    def _write_file(self, path: Path, content: str, mode: int = 0o644) -> None:
+    def _read_text_file(self, path: Path) -> Tuple[str, os.stat_result]:
+        """Read a UTF-8 text file with a single open and no separate existence check
+        
+        Newlines are translated like in text mode.
+        
+        Args:
+            path: Path to the file to read
+            
+        Returns:
+            Tuple of the file content and the file's stat taken while reading it
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            OSError: If reading fails
+        """
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            stat = os.fstat(fd)
+            # Ask for one byte more than the size, a short read means we hit the end
+            data = os.read(fd, stat.st_size + 1)
+            if len(data) > stat.st_size:
+                # The file grew since fstat, read the rest
+                chunks = [data]
+                while chunk := os.read(fd, 65536):
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+        finally:
+            os.close(fd)
+        
+        content = data.decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content, stat
+    
+    def _write_file(self, path: Path, content: str, mode: int = 0o644, atomic: bool = False) -> None:
         """Write content to a file
         
         Args:
             path: Target file path
             content: Content to write
             mode: File permissions (default: 0o644)
+            atomic: Write to a temporary file and rename it over the target, so readers
+                never see a partial file. This replaces the inode, so don't use it for
+                files that are watched by inode.
             
         Raises:
             OSError: If write fails
         """
+        data = content.encode('utf-8')
         try:
-            # Write directly to the file
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
-                f.flush()  # Ensure data is written to disk
-                os.fsync(f.fileno())  # Force filesystem sync
-            
-            # Set permissions
-            path.chmod(mode)
+            if atomic:
+                tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+                try:
+                    self._write_fd(tmp_path, data, mode)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+            else:
+                # Write directly to the file
+                self._write_fd(path, data, mode)
             self.log.info(f"Wrote to {path}")
             
         except Exception:
             self.log.error(f"Failed to write to {path}")
             raise
 
+    @staticmethod
+    def _write_fd(path: Path, data: bytes, mode: int) -> None:
+        """Write bytes to a file with raw os calls, then set its mode and sync it
+        
+        Args:
+            path: Target file path, created or truncated
+            data: Encoded content to write
+            mode: File permissions
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, mode)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fchmod(fd, mode)  # Not subject to the umask and also applies to existing files
+            os.fsync(fd)  # Force filesystem sync
+        finally:
+            os.close(fd)
+
     def _success_response(self, response_type: type, message: str = "", **kwargs) -> Any:
         """Create a standardized success response
         
@@ -105,13 +175,12 @@ class BaseService:
         Returns:
             Success response dict
         """
-        response = {
+        return {
             "success": True,
             "message": message,
-            "error": None
+            "error": None,
+            **kwargs
         }
-        response.update(kwargs)
-        return response
     
     def _error_response(self, response_type: type, error: str, message: str = "", **kwargs) -> Any:
         """Create a standardized error response
@@ -125,10 +194,9 @@ class BaseService:
         Returns:
             Error response dict
         """
-        response = {
+        return {
             "success": False,
             "message": message,
-            "error": error
+            "error": error,
+            **kwargs
         }
-        response.update(kwargs)
-        return response
@@ -8,75 +8,279 @@ This module defines the complete configuration structure for lsfg-vk, managing T
 - Type definitions
 """
 
+from __future__ import annotations
+
+import functools
+import io
+import operator
 import re
 import sys
-from typing import TypedDict, Dict, Any, Union, cast, List
+from types import MappingProxyType
+from typing import TypedDict, Dict, Any, Optional, Union, cast, List, Mapping, Callable, ClassVar
 from dataclasses import dataclass
-from enum import Enum
 from pathlib import Path
 
 # Import shared configuration constants
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from shared_config import CONFIG_SCHEMA_DEF, ConfigFieldType, get_field_names, get_defaults, get_field_types
+from shared_config import CONFIG_SCHEMA_DEF, ConfigFieldType, get_defaults
+
+# TOML parser backends, fastest first. All of them are optional, without any the
+# line parser below is used.
+try:
+    # Rust-backed parser
+    import rtoml
+except ImportError:
+    rtoml = None
+
+try:
+    # tomli wheels are compiled with mypyc, the stdlib tomllib is the same parser in pure Python
+    import tomli as tomllib
+except ImportError:
+    try:
+        import tomllib
+    except ImportError:
+        tomllib = None
+
+
+def _select_toml_backend() -> Optional[tuple]:
+    """Pick the TOML parser to use
+    
+    Returns:
+        (loads function, decode error type) of the fastest available backend, or None
+    """
+    if rtoml is not None:
+        return rtoml.loads, rtoml.TomlParsingError
+    if tomllib is not None:
+        return tomllib.loads, tomllib.TOMLDecodeError
+    return None
+
+
+_TOML_BACKEND = _select_toml_backend()
 
 # Import auto-generated configuration components
-from .config_schema_generated import ConfigurationData, get_script_parsing_logic, get_script_generation_logic
+from .config_schema_generated import ConfigurationData, get_script_parsing_logic
+
+
+# Escapes for TOML basic strings: quote, backslash and control characters
+_TOML_STRING_ESCAPES = str.maketrans({
+    **{chr(code): f"\\u{code:04x}" for code in (*range(0x20), 0x7f)},
+    "\b": "\\b", "\t": "\\t", "\n": "\\n", "\f": "\\f", "\r": "\\r",
+    '"': '\\"', "\\": "\\\\",
+})
+
+
+def toml_string(value: Any) -> str:
+    """Format a value as a quoted TOML basic string"""
+    return f'"{str(value).translate(_TOML_STRING_ESCAPES)}"'
+
+
+# Escape sequences in TOML basic strings, the inverse of _TOML_STRING_ESCAPES
+_TOML_ESCAPE_RE = re.compile(r'\\(?:u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8})|(.))', re.S)
+_TOML_SIMPLE_UNESCAPES = {"b": "\b", "t": "\t", "n": "\n", "f": "\f", "r": "\r", '"': '"', "\\": "\\"}
+
+
+def _unescape_toml_match(match: re.Match) -> str:
+    """Get the character for one escape sequence, unknown escapes are kept as written"""
+    code = match.group(1) or match.group(2)
+    if code is not None:
+        try:
+            return chr(int(code, 16))
+        except ValueError:
+            return match.group(0)
+    return _TOML_SIMPLE_UNESCAPES.get(match.group(3), match.group(0))
+
+
+def unescape_toml_string(value: str) -> str:
+    """Unescape the content of a TOML basic string (without its quotes), the inverse of toml_string"""
+    if "\\" not in value:
+        return value
+    return _TOML_ESCAPE_RE.sub(_unescape_toml_match, value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfigField:
-    """Configuration field definition"""
+    """Configuration field definition
+    
+    Type-specific conversion and formatting live on the subclasses below, picked
+    once per field by make_config_field().
+    """
     name: str
     field_type: ConfigFieldType
     default: Union[bool, int, float, str]
     description: str
     
+    # Python type of the field's values
+    python_type: ClassVar[type] = object
+    # Whether an empty value is left out of the TOML output
+    omit_empty: ClassVar[bool] = False
+    
     def get_toml_value(self, value: Union[bool, int, float, str]) -> Union[bool, int, float, str]:
         """Get the value for TOML output"""
         return value
+    
+    def coerce(self, value: Any) -> Union[bool, int, float, str]:
+        """Convert a value to the field's Python type, leaving correctly typed values untouched"""
+        return value if type(value) is self.python_type else self.python_type(value)
+    
+    def from_toml(self, value: Any) -> Union[bool, int, float, str]:
+        """Convert a value read from a TOML file
+        
+        Raises:
+            ValueError, TypeError: If the value cannot be converted
+        """
+        return self.coerce(value)
+    
+    def accepts(self, value: Any) -> bool:
+        """Check whether a value has a type format_toml can write for this field"""
+        return isinstance(value, self.python_type)
+    
+    def format_toml(self, value: Union[bool, int, float, str]) -> str:
+        """Format a value as a TOML literal"""
+        return str(value)
 
 
-# Use shared configuration schema as source of truth
-CONFIG_SCHEMA: Dict[str, ConfigField] = {
-    field_name: ConfigField(
-        name=field_def["name"],
-        field_type=ConfigFieldType(field_def["fieldType"]),
-        default=field_def["default"],
-        description=field_def["description"]
-    )
-    for field_name, field_def in CONFIG_SCHEMA_DEF.items()
+class BoolField(ConfigField):
+    """Boolean configuration field"""
+    __slots__ = ()
+    python_type = bool
+    
+    def from_toml(self, value: Any) -> bool:
+        # The line parser hands over raw strings, accept the usual spellings
+        if isinstance(value, str):
+            return value.lower() in ('true', '1', 'yes', 'on')
+        return bool(value)
+    
+    def format_toml(self, value: Any) -> str:
+        return "true" if value else "false"
+
+
+class IntField(ConfigField):
+    """Integer configuration field"""
+    __slots__ = ()
+    python_type = int
+    
+    def from_toml(self, value: Any) -> int:
+        # int() would truncate 2.5 and accept true, treat those as invalid like the line parser does
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            raise ValueError(f"Invalid integer value for {self.name}: {value!r}")
+        return self.coerce(value)
+    
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+
+class FloatField(ConfigField):
+    """Float configuration field"""
+    __slots__ = ()
+    python_type = float
+    
+    def accepts(self, value: Any) -> bool:
+        # Whole numbers are often passed as ints, they are valid float values too
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class StrField(ConfigField):
+    """String configuration field"""
+    __slots__ = ()
+    python_type = str
+    omit_empty = True
+    
+    def format_toml(self, value: Any) -> str:
+        return toml_string(value)
+
+
+_FIELD_CLASSES: Dict[ConfigFieldType, type] = {
+    ConfigFieldType.BOOLEAN: BoolField,
+    ConfigFieldType.INTEGER: IntField,
+    ConfigFieldType.FLOAT: FloatField,
+    ConfigFieldType.STRING: StrField,
 }
 
-# Override DLL default to empty (will be populated dynamically)
-CONFIG_SCHEMA["dll"] = ConfigField(
-    name="dll",
-    field_type=ConfigFieldType.STRING,
-    default="",  # Will be populated dynamically based on detection
-    description="specify where Lossless.dll is stored"
-)
 
-# Get script-only fields dynamically from shared config
-SCRIPT_ONLY_FIELDS = {
-    field_name: ConfigField(
+def make_config_field(field_def: Dict[str, Any]) -> ConfigField:
+    """Create the typed ConfigField for a shared_config field definition"""
+    field_type = ConfigFieldType(field_def["fieldType"])
+    return _FIELD_CLASSES[field_type](
         name=field_def["name"],
-        field_type=ConfigFieldType(field_def["fieldType"]),
+        field_type=field_type,
         default=field_def["default"],
         description=field_def["description"]
     )
+
+
+# Use shared configuration schema as source of truth.
+# The schema mappings are read-only since the lookup tables below are derived from them once.
+CONFIG_SCHEMA: Mapping[str, ConfigField] = MappingProxyType({
+    **{
+        field_name: make_config_field(field_def)
+        for field_name, field_def in CONFIG_SCHEMA_DEF.items()
+    },
+    # Override DLL default to empty (will be populated dynamically)
+    "dll": StrField(
+        name="dll",
+        field_type=ConfigFieldType.STRING,
+        default="",  # Will be populated dynamically based on detection
+        description="specify where Lossless.dll is stored"
+    )
+})
+
+# Get script-only fields dynamically from shared config
+SCRIPT_ONLY_FIELDS: Mapping[str, ConfigField] = MappingProxyType({
+    field_name: make_config_field(field_def)
     for field_name, field_def in CONFIG_SCHEMA_DEF.items()
     if field_def.get("location") == "script"
-}
+})
 
 # Complete configuration schema (TOML + script-only fields)
-COMPLETE_CONFIG_SCHEMA = {**CONFIG_SCHEMA, **SCRIPT_ONLY_FIELDS}
+COMPLETE_CONFIG_SCHEMA: Mapping[str, ConfigField] = MappingProxyType({**CONFIG_SCHEMA, **SCRIPT_ONLY_FIELDS})
+
+# Schema views computed once at import; ConfigurationManager hands out copies
+_DEFAULTS_TEMPLATE: Dict[str, Union[bool, int, float, str]] = {
+    **get_defaults(),
+    **{field.name: field.default for field in SCRIPT_ONLY_FIELDS.values()}
+}
+_FIELD_TYPES: Dict[str, ConfigFieldType] = {
+    field_name: field_def.field_type for field_name, field_def in COMPLETE_CONFIG_SCHEMA.items()
+}
+_FIELD_NAMES: List[str] = list(COMPLETE_CONFIG_SCHEMA.keys())
 
+# Read-only profile shared by every parsed [[game]] section that only holds default values.
+# Use ConfigurationManager.get_profile_config() to get a mutable copy of a profile.
+_DEFAULT_PROFILE: Mapping[str, Union[bool, int, float, str]] = MappingProxyType(_DEFAULTS_TEMPLATE)
 
-# Import auto-generated configuration components
-from .config_schema_generated import ConfigurationData, get_script_parsing_logic, get_script_generation_logic
 
 # Constants for profile management
 DEFAULT_PROFILE_NAME = "decky-lsfg-vk"
-GLOBAL_SECTION_FIELDS = {"dll", "no_fp16"}
+GLOBAL_SECTION_FIELDS = frozenset({"dll", "no_fp16"})
+# Characters that could cause issues in shell scripts or TOML, and names used by the TOML layout
+_INVALID_PROFILE_NAME_CHARS = frozenset(' \t\n\r\'"\\/$|&;()<>{}[]`*?')
+_RESERVED_PROFILE_NAMES = frozenset({'global', 'game', 'current_profile'})
+
+# Interned section headers so the line parser can compare them by identity
+_GLOBAL_HEADER = sys.intern("[global]")
+_GAME_HEADER = sys.intern("[[game]]")
+
+# One match per meaningful line for the line parser: either a section header (group 1)
+# or a key (group 2) and value (group 3), both stripped. Comment lines never match.
+_TOML_LINE_RE = re.compile(r'^[ \t]*(?:(\[.*\])|([^#\s=][^=\n]*?|)[ \t]*=[ \t]*(.*?))[ \t\r]*$', re.M)
+
+# Patterns for editing the [global] dll line of an existing file in place
+_GLOBAL_HEADER_RE = re.compile(r'^[ \t]*\[global\][ \t\r]*$', re.M)
+_SECTION_HEADER_RE = re.compile(r'^[ \t]*\[', re.M)
+_DLL_LINE_RE = re.compile(r'^[ \t]*dll[ \t]*=[^\r\n]*', re.M)
+
+# Per-game section emitters: (field name, comment block, "key = " prefix, field definition).
+# The comment block starts with the blank line separating it from the previous entry.
+_GAME_FIELD_EMITTERS = [
+    (field_name, f"\n# {field_def.description}\n", f"{field_name} = ", field_def)
+    for field_name, field_def in CONFIG_SCHEMA.items()
+    if field_name not in GLOBAL_SECTION_FIELDS
+]
+# Fetches all emitted values of a complete profile config as a tuple, in emitter order
+_GAME_FIELD_VALUES = operator.itemgetter(*(field_name for field_name, _, _, _ in _GAME_FIELD_EMITTERS))
+
+# Launch script parser, built once
+_parse_script_values = get_script_parsing_logic()
 
 # Note: ConfigurationData is now imported from generated file
 # No need to manually maintain the TypedDict anymore!
@@ -85,7 +289,7 @@ GLOBAL_SECTION_FIELDS = {"dll", "no_fp16"}
 class ProfileData(TypedDict):
     """Profile data with current profile tracking"""
     current_profile: str
-    profiles: Dict[str, ConfigurationData]  # profile_name -> config
+    profiles: Dict[str, ConfigurationData]  # profile_name -> config (may be read-only, copy before mutating)
     global_config: Dict[str, Any]  # Global settings (dll, no_fp16)
 
 
@@ -95,16 +299,35 @@ class ConfigurationManager:
     @staticmethod
     def get_defaults() -> ConfigurationData:
         """Get default configuration values"""
-        # Use shared defaults and add script-only fields
-        shared_defaults = get_defaults()
+        return cast(ConfigurationData, _DEFAULTS_TEMPLATE.copy())
+    
+    @staticmethod
+    def get_defaults_view() -> Mapping[str, Union[bool, int, float, str]]:
+        """Get a read-only view of the default configuration values
         
-        # Add script-only fields that aren't in the shared schema
-        script_defaults = {
-            field.name: field.default 
-            for field in SCRIPT_ONLY_FIELDS.values()
-        }
+        Use this instead of get_defaults() when the values are only read, it
+        doesn't copy anything.
+        """
+        return _DEFAULT_PROFILE
+    
+    @staticmethod
+    def get_profile_config(profile_data: ProfileData, profile_name: str) -> ConfigurationData:
+        """Get a mutable copy of a profile's configuration
+        
+        Parsed profiles that only hold default values share one read-only mapping,
+        so callers that modify or return a profile config should go through this.
         
-        return cast(ConfigurationData, {**shared_defaults, **script_defaults})
+        Args:
+            profile_data: Profile data to read from
+            profile_name: Name of the profile
+            
+        Returns:
+            Copy of the profile's configuration, or defaults if the profile doesn't exist
+        """
+        config = profile_data["profiles"].get(profile_name)
+        if config is None:
+            return ConfigurationManager.get_defaults()
+        return cast(ConfigurationData, dict(config))
     
     @staticmethod
     def get_defaults_with_dll_detection(dll_detection_service=None) -> ConfigurationData:
@@ -137,18 +360,12 @@ class ConfigurationManager:
     @staticmethod
     def get_field_names() -> list[str]:
         """Get ordered list of configuration field names"""
-        # Use shared field names and add script-only fields
-        shared_names = get_field_names()
-        script_names = list(SCRIPT_ONLY_FIELDS.keys())
-        return shared_names + script_names
+        return list(_FIELD_NAMES)
     
     @staticmethod
     def get_field_types() -> Dict[str, ConfigFieldType]:
         """Get field type mapping"""
-        # Use shared field types and add script-only field types
-        shared_types = {name: ConfigFieldType(type_str) for name, type_str in get_field_types().items()}
-        script_types = {field.name: field.field_type for field in SCRIPT_ONLY_FIELDS.values()}
-        return {**shared_types, **script_types}
+        return dict(_FIELD_TYPES)
     
     @staticmethod
     def validate_config(config: Dict[str, Any]) -> ConfigurationData:
@@ -156,19 +373,7 @@ class ConfigurationManager:
         validated = {}
         
         for field_name, field_def in COMPLETE_CONFIG_SCHEMA.items():
-            value = config.get(field_name, field_def.default)
-            
-            # Type validation and conversion
-            if field_def.field_type == ConfigFieldType.BOOLEAN:
-                validated[field_name] = bool(value)
-            elif field_def.field_type == ConfigFieldType.INTEGER:
-                validated[field_name] = int(value)
-            elif field_def.field_type == ConfigFieldType.FLOAT:
-                validated[field_name] = float(value)
-            elif field_def.field_type == ConfigFieldType.STRING:
-                validated[field_name] = str(value)
-            else:
-                validated[field_name] = value
+            validated[field_name] = field_def.coerce(config.get(field_name, field_def.default))
         
         return cast(ConfigurationData, validated)
     
@@ -189,29 +394,29 @@ class ConfigurationManager:
     @staticmethod
     def generate_toml_content_multi_profile(profile_data: ProfileData) -> str:
         """Generate TOML configuration file content with multiple profiles"""
-        lines = ["version = 1"]
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        
+        # Blank separator lines are written at the start of each following block
+        w("version = 1\n\n")
         
         # Add global section with global fields
-        lines.append("[global]")
+        w("[global]\n")
         
         # Add current_profile field
-        lines.append(f"# Currently selected profile")
-        lines.append(f'current_profile = "{profile_data["current_profile"]}"')
-        lines.append("")
+        w("# Currently selected profile\n")
+        w(f'current_profile = {toml_string(profile_data["current_profile"])}\n\n')
         
         # Add dll field if specified
         dll_path = profile_data["global_config"].get("dll", "")
         if dll_path:
-            lines.append(f"# specify where Lossless.dll is stored")
-            lines.append(f'dll = "{dll_path}"')
-            lines.append("")
+            w("# specify where Lossless.dll is stored\n")
+            w(f"dll = {toml_string(dll_path)}\n\n")
             
         # Add no_fp16 field
         no_fp16 = profile_data["global_config"].get("no_fp16", False)
-        lines.append(f"# force-disable fp16 (use on older nvidia cards)")
-        lines.append(f"no_fp16 = {str(no_fp16).lower()}")
-        lines.append("")
+        w("# force-disable fp16 (use on older nvidia cards)\n")
+        w(f"no_fp16 = {str(no_fp16).lower()}\n")
         
         # Add game sections for each profile
         # Sort profiles to ensure consistent order (default profile first)
@@ -219,36 +424,91 @@ class ConfigurationManager:
                                key=lambda x: (x[0] != DEFAULT_PROFILE_NAME, x[0]))
         
         for profile_name, config in sorted_profiles:
-            lines.append("[[game]]")
             if profile_name == DEFAULT_PROFILE_NAME:
-                lines.append("# Plugin-managed game entry (default profile)")
+                header_comment = "Plugin-managed game entry (default profile)"
             else:
-                lines.append(f"# Profile: {profile_name}")
-            lines.append(f'exe = "{profile_name}"')
-            lines.append("")
+                header_comment = f"Profile: {profile_name}"
+            ConfigurationManager._write_game_section(w, profile_name, config, header_comment)
+        
+        return buf.getvalue()
+    
+    @staticmethod
+    def _write_game_section(write: Callable[[str], int], exe: str, config: ConfigurationData,
+                            header_comment: str) -> None:
+        """Write one [[game]] section, preceded by its blank separator line
+        
+        Args:
+            write: Write function of the output buffer
+            exe: Value for the section's exe key (the profile name)
+            config: Profile configuration to write
+            header_comment: Comment placed under the section header
+        """
+        write(f"\n[[game]]\n# {header_comment}\nexe = {toml_string(exe)}\n")
+        
+        # Profiles holding only default values share one mapping, render its fields only once
+        if config is _DEFAULT_PROFILE:
+            write(ConfigurationManager._default_game_fields())
+        else:
+            ConfigurationManager._write_game_fields(write, config)
+    
+    @staticmethod
+    @functools.cache
+    def _default_game_fields() -> str:
+        """Get the rendered fields of a [[game]] section holding the default profile"""
+        buf = io.StringIO()
+        ConfigurationManager._write_game_fields(buf.write, _DEFAULT_PROFILE)
+        return buf.getvalue()
+    
+    @staticmethod
+    def _write_game_fields(write: Callable[[str], int], config: Mapping[str, Any]) -> None:
+        """Write the per-game fields of a profile, each with its comment block
+        
+        Args:
+            write: Write function of the output buffer
+            config: Profile configuration to write
+        """
+        # Add all configuration fields to the game section (global fields go in global section)
+        try:
+            values = _GAME_FIELD_VALUES(config)
+        except KeyError:
+            # Partial config, missing fields get their default value
+            values = [config.get(field_name, field_def.default)
+                      for field_name, _, _, field_def in _GAME_FIELD_EMITTERS]
+        
+        for (_, comment, prefix, field_def), value in zip(_GAME_FIELD_EMITTERS, values):
+            write(comment)
+            # Values of another type (e.g. None) and empty strings are left out, so
+            # lsfg-vk falls back to its own default
+            if field_def.accepts(value) and (value or not field_def.omit_empty):
+                write(prefix)
+                write(field_def.format_toml(value))
+                write("\n")
+    
+    @staticmethod
+    def replace_global_dll(content: str, dll_path: str) -> Optional[str]:
+        """Replace the dll value of the [global] section in existing TOML content
+        
+        The rest of the content is left untouched, so a DLL path change doesn't need
+        the whole file regenerated.
+        
+        Args:
+            content: Existing TOML content
+            dll_path: New DLL path
             
-            # Add all configuration fields to the game section (excluding global fields)
-            for field_name, field_def in CONFIG_SCHEMA.items():
-                # Skip global fields - they go in global section
-                if field_name in GLOBAL_SECTION_FIELDS:
-                    continue
-                    
-                value = config.get(field_name, field_def.default)
-                
-                # Add field description comment
-                lines.append(f"# {field_def.description}")
-                
-                # Format value based on type
-                if isinstance(value, bool):
-                    lines.append(f"{field_name} = {str(value).lower()}")
-                elif isinstance(value, str) and value:  # Only add non-empty strings
-                    lines.append(f'{field_name} = "{value}"')
-                elif isinstance(value, (int, float)):  # Always include numbers, even if 0 or 1
-                    lines.append(f"{field_name} = {value}")
-                
-                lines.append("")  # Empty line for readability
+        Returns:
+            Updated content, or None if the [global] section has no dll line to replace
+        """
+        header = _GLOBAL_HEADER_RE.search(content)
+        if header is None:
+            return None
         
-        return "\n".join(lines)
+        next_section = _SECTION_HEADER_RE.search(content, header.end())
+        section_end = next_section.start() if next_section else len(content)
+        dll_line = _DLL_LINE_RE.search(content, header.end(), section_end)
+        if dll_line is None:
+            return None
+        
+        return f"{content[:dll_line.start()]}dll = {toml_string(dll_path)}{content[dll_line.end():]}"
     
     @staticmethod
     def parse_toml_content(content: str) -> ConfigurationData:
@@ -256,161 +516,217 @@ class ConfigurationManager:
         profile_data = ConfigurationManager.parse_toml_content_multi_profile(content)
         current_profile = profile_data["current_profile"]
         
-        # Merge global config with current profile config
-        current_config = profile_data["profiles"].get(current_profile, ConfigurationManager.get_defaults())
-        
-        # Add global fields to the config
-        for field_name in GLOBAL_SECTION_FIELDS:
-            if field_name in profile_data["global_config"]:
-                current_config[field_name] = profile_data["global_config"][field_name]
+        # Merge global config with current profile config in a single copy.
+        # The parsers only put global fields (GLOBAL_SECTION_FIELDS) into global_config.
+        current_config = {
+            **profile_data["profiles"].get(current_profile, _DEFAULT_PROFILE),
+            **profile_data["global_config"]
+        }
         
-        return current_config
+        return cast(ConfigurationData, current_config)
     
     @staticmethod
     def parse_toml_content_multi_profile(content: str) -> ProfileData:
-        """Parse TOML content into profile data structure"""
-        profiles: Dict[str, ConfigurationData] = {}
-        global_config: Dict[str, Any] = {}
-        current_profile = DEFAULT_PROFILE_NAME
+        """Parse TOML content into profile data structure
+        
+        Results are cached by content, so re-reading an unchanged file skips parsing.
+        The profiles and global_config dicts are fresh copies, but the profile configs
+        themselves are read-only (use get_profile_config() for a mutable copy).
+        """
+        cached = ConfigurationManager._parse_profile_data_cached(content)
+        return ProfileData(
+            current_profile=cached["current_profile"],
+            profiles=dict(cached["profiles"]),
+            global_config=dict(cached["global_config"])
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_profile_data_cached(content: str) -> ProfileData:
+        """Parse TOML content once per distinct content, freezing the profile configs"""
+        profile_data = ConfigurationManager._parse_profile_data(content)
+        profile_data["profiles"] = {
+            name: config if isinstance(config, MappingProxyType) else MappingProxyType(config)
+            for name, config in profile_data["profiles"].items()
+        }
+        return profile_data
+    
+    @staticmethod
+    def _parse_profile_data(content: str) -> ProfileData:
+        """Parse TOML content with the selected TOML backend, falling back to the lenient line parser"""
+        # Settings only come from the [global] table and [[game]] entries. If neither name
+        # appears (empty, truncated or unrelated file) both parsers would return the defaults.
+        if "global" not in content and "game" not in content:
+            return ConfigurationManager._finalize_profile_data({}, {}, DEFAULT_PROFILE_NAME)
         
         try:
-            # Look for both [global] and [[game]] sections
-            lines = content.split('\n')
-            in_global_section = False
-            in_game_section = False
-            current_game_exe = None
-            current_game_config: Dict[str, Any] = {}
+            if _TOML_BACKEND is not None:
+                loads, decode_error = _TOML_BACKEND
+                try:
+                    data = loads(content)
+                except decode_error:
+                    # Hand-edited files are not always strict TOML, use the lenient line parser
+                    pass
+                else:
+                    return ConfigurationManager._profile_data_from_toml(data)
             
-            for line in lines:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Check for section headers
-                if line.startswith('[') and line.endswith(']'):
-                    # Save previous game section if we were in one
-                    if in_game_section and current_game_exe:
-                        # Validate and store the profile config
-                        validated_config = ConfigurationManager.get_defaults()
-                        for key, value in current_game_config.items():
-                            if key in CONFIG_SCHEMA:
-                                field_def = CONFIG_SCHEMA[key]
-                                try:
-                                    if field_def.field_type == ConfigFieldType.BOOLEAN:
-                                        validated_config[key] = value
-                                    elif field_def.field_type == ConfigFieldType.INTEGER:
-                                        validated_config[key] = int(value) if not isinstance(value, int) else value
-                                    elif field_def.field_type == ConfigFieldType.FLOAT:
-                                        validated_config[key] = float(value) if not isinstance(value, float) else value
-                                    elif field_def.field_type == ConfigFieldType.STRING:
-                                        validated_config[key] = str(value)
-                                except (ValueError, TypeError):
-                                    # If conversion fails, keep default value
-                                    pass
-                        profiles[current_game_exe] = validated_config
-                        current_game_config = {}
-                    
-                    # Set new section state
-                    if line == '[global]':
-                        in_global_section = True
-                        in_game_section = False
-                    elif line == '[[game]]':
-                        in_global_section = False
-                        in_game_section = True
-                        current_game_exe = None
-                    else:
-                        in_global_section = False
-                        in_game_section = False
-                    continue
-                
-                # Parse key = value lines
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes from string values
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Handle global section
-                    if in_global_section:
-                        if key == "current_profile":
-                            current_profile = value
-                        elif key == "dll":
-                            global_config["dll"] = value
-                        elif key == "no_fp16":
-                            global_config["no_fp16"] = value.lower() in ('true', '1', 'yes', 'on')
-                    
-                    # Handle game section
-                    elif in_game_section:
-                        # Track the exe for this game section
-                        if key == "exe":
-                            current_game_exe = value
-                        # Store config fields for current game
-                        elif key in CONFIG_SCHEMA:
-                            field_def = CONFIG_SCHEMA[key]
-                            try:
-                                if field_def.field_type == ConfigFieldType.BOOLEAN:
-                                    current_game_config[key] = value.lower() in ('true', '1', 'yes', 'on')
-                                elif field_def.field_type == ConfigFieldType.INTEGER:
-                                    current_game_config[key] = int(value)
-                                elif field_def.field_type == ConfigFieldType.FLOAT:
-                                    current_game_config[key] = float(value)
-                                elif field_def.field_type == ConfigFieldType.STRING:
-                                    current_game_config[key] = value
-                            except (ValueError, TypeError):
-                                # If conversion fails, keep default value
-                                pass
-            
-            # Handle final game section if we were in one
-            if in_game_section and current_game_exe:
-                validated_config = ConfigurationManager.get_defaults()
-                for key, value in current_game_config.items():
-                    if key in CONFIG_SCHEMA:
-                        field_def = CONFIG_SCHEMA[key]
-                        try:
-                            if field_def.field_type == ConfigFieldType.BOOLEAN:
-                                validated_config[key] = value
-                            elif field_def.field_type == ConfigFieldType.INTEGER:
-                                validated_config[key] = int(value) if not isinstance(value, int) else value
-                            elif field_def.field_type == ConfigFieldType.FLOAT:
-                                validated_config[key] = float(value) if not isinstance(value, float) else value
-                            elif field_def.field_type == ConfigFieldType.STRING:
-                                validated_config[key] = str(value)
-                        except (ValueError, TypeError):
-                            # If conversion fails, keep default value
-                            pass
-                profiles[current_game_exe] = validated_config
-            
-            # Ensure we have at least the default profile
-            if not profiles:
-                profiles[DEFAULT_PROFILE_NAME] = ConfigurationManager.get_defaults()
-            
-            # Ensure current_profile exists in profiles
-            if current_profile not in profiles:
-                current_profile = DEFAULT_PROFILE_NAME
-                if DEFAULT_PROFILE_NAME not in profiles:
-                    profiles[DEFAULT_PROFILE_NAME] = ConfigurationManager.get_defaults()
-            
-            return ProfileData(
-                current_profile=current_profile,
-                profiles=profiles,
-                global_config=global_config
-            )
+            return ConfigurationManager._parse_toml_lines(content)
             
         except Exception:
             # If parsing fails completely, return default profile structure
             return ProfileData(
                 current_profile=DEFAULT_PROFILE_NAME,
-                profiles={DEFAULT_PROFILE_NAME: ConfigurationManager.get_defaults()},
+                profiles={DEFAULT_PROFILE_NAME: cast(ConfigurationData, _DEFAULT_PROFILE)},
                 global_config={}
             )
     
+    @staticmethod
+    def _profile_data_from_toml(data: Dict[str, Any]) -> ProfileData:
+        """Build profile data from an already parsed TOML document"""
+        profiles: Dict[str, ConfigurationData] = {}
+        global_config: Dict[str, Any] = {}
+        current_profile = DEFAULT_PROFILE_NAME
+        
+        global_section = data.get("global", {})
+        if isinstance(global_section, dict):
+            if "current_profile" in global_section:
+                current_profile = str(global_section["current_profile"])
+            if "dll" in global_section:
+                global_config["dll"] = str(global_section["dll"])
+            if "no_fp16" in global_section:
+                global_config["no_fp16"] = CONFIG_SCHEMA["no_fp16"].from_toml(global_section["no_fp16"])
+        
+        game_sections = data.get("game", [])
+        if not isinstance(game_sections, list):
+            game_sections = []
+        
+        for game in game_sections:
+            if not isinstance(game, dict) or not game.get("exe"):
+                continue
+            
+            profiles[str(game["exe"])] = ConfigurationManager._build_profile_config(game)
+        
+        return ConfigurationManager._finalize_profile_data(profiles, global_config, current_profile)
+    
+    @staticmethod
+    def _parse_toml_lines(content: str) -> ProfileData:
+        """Parse TOML content line by line
+        
+        Fallback for when tomllib is unavailable or the file is not strict TOML
+        (e.g. unquoted strings or yes/no booleans written by hand).
+        """
+        profiles: Dict[str, ConfigurationData] = {}
+        global_config: Dict[str, Any] = {}
+        current_profile = DEFAULT_PROFILE_NAME
+        
+        # Look for both [global] and [[game]] sections
+        in_global_section = False
+        in_game_section = False
+        current_game_exe = None
+        current_game_config: Dict[str, Any] = {}
+        
+        for header, key, value in (match.groups() for match in _TOML_LINE_RE.finditer(content)):
+            # Check for section headers
+            if header is not None:
+                # Save previous game section if we were in one
+                if in_game_section and current_game_exe:
+                    profiles[current_game_exe] = ConfigurationManager._build_profile_config(current_game_config)
+                    current_game_config = {}
+                
+                # Set new section state
+                header = sys.intern(header)
+                if header is _GLOBAL_HEADER:
+                    in_global_section = True
+                    in_game_section = False
+                elif header is _GAME_HEADER:
+                    in_global_section = False
+                    in_game_section = True
+                    current_game_exe = None
+                else:
+                    in_global_section = False
+                    in_game_section = False
+            
+            # Parse key = value lines
+            else:
+                # Schema keys are interned identifiers, interning the parsed key lets lookups match by identity
+                key = sys.intern(key)
+                
+                # Remove quotes from string values, basic strings may also contain escapes
+                quote = value[:1]
+                if quote == '"' and value[-1:] == quote:
+                    value = unescape_toml_string(value[1:-1])
+                elif quote == "'" and value[-1:] == quote:
+                    value = value[1:-1]
+                
+                # Handle global section
+                if in_global_section:
+                    if key == "current_profile":
+                        current_profile = value
+                    elif key == "dll":
+                        global_config["dll"] = value
+                    elif key == "no_fp16":
+                        global_config["no_fp16"] = value.lower() in ('true', '1', 'yes', 'on')
+                
+                # Handle game section
+                elif in_game_section:
+                    # Track the exe for this game section
+                    if key == "exe":
+                        current_game_exe = value
+                    # Store config fields for current game, converted when the section closes
+                    elif key in CONFIG_SCHEMA:
+                        current_game_config[key] = value
+        
+        # Handle final game section if we were in one
+        if in_game_section and current_game_exe:
+            profiles[current_game_exe] = ConfigurationManager._build_profile_config(current_game_config)
+        
+        return ConfigurationManager._finalize_profile_data(profiles, global_config, current_profile)
+    
+    @staticmethod
+    def _build_profile_config(values: Mapping[str, Any]) -> ConfigurationData:
+        """Build a profile config from the values parsed out of one [[game]] section
+        
+        The defaults are only copied once a value actually differs from them, so
+        sections that just repeat the defaults share the read-only default profile.
+        Keys outside the schema (like exe) are ignored.
+        """
+        config = None
+        for key, value in values.items():
+            field_def = CONFIG_SCHEMA.get(key)
+            if field_def is None:
+                continue
+            try:
+                value = field_def.from_toml(value)
+            except (ValueError, TypeError):
+                # If conversion fails, keep default value
+                continue
+            if value != _DEFAULTS_TEMPLATE[key]:
+                if config is None:
+                    config = _DEFAULTS_TEMPLATE.copy()
+                config[key] = value
+        
+        return cast(ConfigurationData, config if config is not None else _DEFAULT_PROFILE)
+    
+    @staticmethod
+    def _finalize_profile_data(profiles: Dict[str, ConfigurationData], global_config: Dict[str, Any],
+                               current_profile: str) -> ProfileData:
+        """Ensure the default profile exists and current_profile points at a known profile"""
+        # Ensure we have at least the default profile
+        if not profiles:
+            profiles[DEFAULT_PROFILE_NAME] = cast(ConfigurationData, _DEFAULT_PROFILE)
+        
+        # Ensure current_profile exists in profiles
+        if current_profile not in profiles:
+            current_profile = DEFAULT_PROFILE_NAME
+            if DEFAULT_PROFILE_NAME not in profiles:
+                profiles[DEFAULT_PROFILE_NAME] = cast(ConfigurationData, _DEFAULT_PROFILE)
+        
+        return ProfileData(
+            current_profile=current_profile,
+            profiles=profiles,
+            global_config=global_config
+        )
+    
     @staticmethod
     def parse_script_content(script_content: str) -> Dict[str, Union[bool, int, str]]:
         """Parse launch script content to extract environment variable values
@@ -422,8 +738,7 @@ class ConfigurationManager:
             Dict containing parsed script-only field values
         """
         # Use auto-generated parsing logic
-        parse_script_values = get_script_parsing_logic()
-        return parse_script_values(script_content.split('\n'))
+        return _parse_script_values(script_content)
     
     @staticmethod
     def merge_config_with_script(toml_config: ConfigurationData, script_values: Dict[str, Union[bool, int, str]]) -> ConfigurationData:
@@ -445,12 +760,17 @@ class ConfigurationManager:
         
         return cast(ConfigurationData, merged_config)
 
-    @staticmethod
     @staticmethod
     def create_config_from_args(**kwargs) -> ConfigurationData:
-        """Create configuration from keyword arguments - USES GENERATED CODE"""
-        from .config_schema_generated import create_config_dict
-        return create_config_dict(**kwargs)
+        """Create configuration from keyword arguments, missing fields get their default value
+        
+        Missing global fields (dll, no_fp16) are left out instead, so they don't overwrite
+        the global settings when the config is saved.
+        """
+        config = {field_name: value for field_name, value in _DEFAULTS_TEMPLATE.items()
+                  if field_name not in GLOBAL_SECTION_FIELDS or field_name in kwargs}
+        config.update((key, value) for key, value in kwargs.items() if key in _DEFAULTS_TEMPLATE)
+        return cast(ConfigurationData, config)
     
     @staticmethod
     def validate_profile_name(profile_name: str) -> bool:
@@ -459,13 +779,11 @@ class ConfigurationManager:
             return False
         
         # Check for invalid characters that could cause issues in shell scripts or TOML
-        invalid_chars = set(' \t\n\r\'"\\/$|&;()<>{}[]`*?')
-        if any(char in invalid_chars for char in profile_name):
+        if not _INVALID_PROFILE_NAME_CHARS.isdisjoint(profile_name):
             return False
         
         # Check for reserved names
-        reserved_names = {'global', 'game', 'current_profile'}
-        if profile_name.lower() in reserved_names:
+        if profile_name.lower() in _RESERVED_PROFILE_NAMES:
             return False
         
         return True
@@ -519,7 +837,7 @@ class ConfigurationManager:
             new_profile_data["current_profile"] = DEFAULT_PROFILE_NAME
             # Ensure default profile exists
             if DEFAULT_PROFILE_NAME not in new_profile_data["profiles"]:
-                new_profile_data["profiles"][DEFAULT_PROFILE_NAME] = ConfigurationManager.get_defaults()
+                new_profile_data["profiles"][DEFAULT_PROFILE_NAME] = cast(ConfigurationData, _DEFAULT_PROFILE)
         
         return new_profile_data
     
@@ -47,39 +47,36 @@ class ConfigurationData(TypedDict):
     enable_wsi: bool
 
 
+# Launch script parsing: `export KEY=VALUE` lines are dispatched per variable
+_SCRIPT_DISPATCH = {
+    "DXVK_FRAME_RATE": ("dxvk_frame_rate", int),
+    "PROTON_USE_WOW64": ("enable_wow64", lambda value: value == "1"),
+    "SteamDeck": ("disable_steamdeck_mode", lambda value: value == "0"),
+    "MANGOHUD": ("mangohud_workaround", lambda value: value == "1"),
+    "DISABLE_VKBASALT": ("disable_vkbasalt", lambda value: value == "1"),
+    "ENABLE_VKBASALT": ("force_enable_vkbasalt", lambda value: value == "1"),
+    "ENABLE_GAMESCOPE_WSI": ("enable_wsi", lambda value: value != "0"),
+}
+
+
 def get_script_parsing_logic():
     """Return the script parsing logic as a callable"""
-    def parse_script_values(lines):
+    def parse_script_values(script_content):
         script_values = {}
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#") or not line.startswith("export "):
+        for line in script_content.split("\n"):
+            line = line.lstrip(" \t")
+            # "export" followed by at least one space or tab
+            if not line.startswith("export") or line[6:7] not in (" ", "\t"):
                 continue
-            if "=" in line:
-                export_line = line[len("export "):]
-                key, value = export_line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Auto-generated parsing logic:
-                if key == "DXVK_FRAME_RATE":
-                        try:
-                            script_values["dxvk_frame_rate"] = int(value)
-                        except ValueError:
-                            pass
-                if key == "PROTON_USE_WOW64":
-                        script_values["enable_wow64"] = value == "1"
-                if key == "SteamDeck":
-                        script_values["disable_steamdeck_mode"] = value == "0"
-                if key == "MANGOHUD":
-                        script_values["mangohud_workaround"] = value == "1"
-                if key == "DISABLE_VKBASALT":
-                        script_values["disable_vkbasalt"] = value == "1"
-                if key == "ENABLE_VKBASALT":
-                        script_values["force_enable_vkbasalt"] = value == "1"
-                if key == "ENABLE_GAMESCOPE_WSI":
-                        script_values["enable_wsi"] = value != "0"
-
+            key, sep, value = line[7:].partition("=")
+            entry = _SCRIPT_DISPATCH.get(key.strip(" \t"))
+            if entry is None or not sep:
+                continue
+            field_name, convert = entry
+            try:
+                script_values[field_name] = convert(value.lstrip(" \t").rstrip(" \t\r"))
+            except ValueError:
+                pass
         return script_values
     return parse_script_values
 
@@ -2,49 +2,145 @@
 Configuration service for TOML-based lsfg configuration management.
 """
 
+import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from .base_service import BaseService
-from .config_schema import ConfigurationManager, CONFIG_SCHEMA, ProfileData, DEFAULT_PROFILE_NAME
-from .config_schema_generated import ConfigurationData, get_script_generation_logic
+from .config_schema import (
+    ConfigurationManager, CONFIG_SCHEMA, ProfileData, DEFAULT_PROFILE_NAME, GLOBAL_SECTION_FIELDS
+)
+from .config_schema_generated import ConfigurationData, DLL, get_script_generation_logic
+from .dll_detection import DllDetectionService
 from .configuration_helpers_generated import log_configuration_update
 from .types import ConfigurationResponse, ProfilesResponse, ProfileResponse
 
+# Launch script layout (a str.format template), only the profile comment, the exports and
+# LSFG_PROCESS vary
+_SCRIPT_TEMPLATE = """\
+#!/bin/bash
+# lsfg-vk launch script generated by decky-lossless-scaling-vk plugin
+{profile_comment}# This script sets up the environment for lsfg-vk to work with the plugin configuration
+{exports}export LSFG_PROCESS={lsfg_process}
+exec "$@"
+"""
+
+# Auto-generated export lines for the script-only fields
+_generate_script_lines = get_script_generation_logic()
+
 
 class ConfigurationService(BaseService):
     """Service for managing TOML-based lsfg configuration"""
     
+    def __init__(self, logger: Optional[Any] = None):
+        """Initialize configuration service
+        
+        Args:
+            logger: Logger instance, defaults to decky.logger if None
+        """
+        super().__init__(logger)
+        
+        # Merged config from the last get_config() call, keyed by the signatures of the
+        # config file and launch script it was read from
+        self._config_cache: Optional[Tuple[Tuple[Any, Any], ConfigurationData]] = None
+        # Config file content keyed by the file signature it was read at
+        self._content_cache: Optional[Tuple[Tuple[int, int], str]] = None
+        # Launch script content keyed by the file signature it was last read or written at
+        self._script_cache: Optional[Tuple[Tuple[int, int], str]] = None
+        # Created on first use, it remembers the last detected DLL between calls
+        self._dll_detection_service: Optional[DllDetectionService] = None
+    
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Get a cheap change signature for a file
+        
+        Args:
+            path: Path to the file
+            
+        Returns:
+            (mtime in ns, size) of the file, or None if it doesn't exist
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _get_dll_detection_service(self) -> DllDetectionService:
+        """Get the DLL detection service shared by this service's calls
+        
+        Returns:
+            DllDetectionService instance, created on first use
+        """
+        if self._dll_detection_service is None:
+            self._dll_detection_service = DllDetectionService(self.log)
+        return self._dll_detection_service
+    
+    def _get_defaults_with_dll_detection(self) -> ConfigurationData:
+        """Get default configuration values with the detected DLL path
+        
+        The detection service reuses its result while the detected DLL still exists,
+        so this doesn't rescan the Steam directories on every call.
+        
+        Returns:
+            ConfigurationData with detected DLL path if available
+        """
+        return ConfigurationManager.get_defaults_with_dll_detection(self._get_dll_detection_service())
+    
+    def _write_file(self, path: Path, content: str, mode: int = 0o644, atomic: bool = False) -> None:
+        """Write content to a file, dropping the cached content of that file and the merged config"""
+        self._config_cache = None
+        if path == self.config_file_path:
+            self._content_cache = None
+        elif path == self.lsfg_script_path:
+            self._script_cache = None
+        super()._write_file(path, content, mode, atomic)
+    
     def get_config(self) -> ConfigurationResponse:
         """Read current TOML configuration merged with launch script environment variables
         
+        The merged result is cached until the config file or launch script changes on disk.
+        
         Returns:
             ConfigurationResponse with current configuration or error
         """
         try:
+            config_signature = self._file_signature(self.config_file_path)
+            script_signature = self._file_signature(self.lsfg_script_path)
+            cache_key = (config_signature, script_signature)
+            
             # Get TOML configuration (with defaults if file doesn't exist)
-            if not self.config_file_path.exists():
-                # Return default configuration with DLL detection if file doesn't exist
-                from .dll_detection import DllDetectionService
-                dll_service = DllDetectionService(self.log)
-                toml_config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
+            if config_signature is None:
+                # Return default configuration with DLL detection if file doesn't exist.
+                # Not cached with the merged config, the detected DLL can change without any file here changing.
+                toml_config = self._get_defaults_with_dll_detection()
             else:
-                content = self.config_file_path.read_text(encoding='utf-8')
+                cached = self._config_cache
+                if cached is not None and cached[0] == cache_key:
+                    return self._success_response(ConfigurationResponse, config=dict(cached[1]))
+                
+                content = self._read_config_content()
+                if content is None:
+                    raise FileNotFoundError(f"Config file disappeared: {self.config_file_path}")
                 toml_config = ConfigurationManager.parse_toml_content(content)
             
             # Get script environment variables (if script exists)
             script_values = {}
-            if self.lsfg_script_path.exists():
+            if script_signature is not None:
                 try:
-                    script_content = self.lsfg_script_path.read_text(encoding='utf-8')
+                    script_content, _ = self._read_text_file(self.lsfg_script_path)
                     script_values = ConfigurationManager.parse_script_content(script_content)
-                    self.log.info(f"Parsed script values: {script_values}")
+                    self.log.info("Parsed script values: %s", script_values)
                 except Exception as e:
                     self.log.warning(f"Failed to parse launch script: {str(e)}")
             
             # Merge TOML config with script values
             config = ConfigurationManager.merge_config_with_script(toml_config, script_values)
             
+            if config_signature is not None:
+                self._config_cache = (cache_key, config)
+                config = dict(config)
+            
             return self._success_response(ConfigurationResponse, config=config)
             
         except (OSError, IOError) as e:
@@ -55,9 +151,7 @@ class ConfigurationService(BaseService):
             error_msg = f"Error parsing config file: {str(e)}"
             self.log.error(error_msg)
             # Return defaults with DLL detection if parsing fails
-            from .dll_detection import DllDetectionService
-            dll_service = DllDetectionService(self.log)
-            config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
+            config = self._get_defaults_with_dll_detection()
             return self._success_response(ConfigurationResponse, 
                                         f"Using default configuration due to parse error: {str(e)}", 
                                         config=config)
@@ -75,8 +169,8 @@ class ConfigurationService(BaseService):
             profile_data = self._get_profile_data()
             current_profile = profile_data["current_profile"]
             
-            # Update the current profile's config
-            return self.update_profile_config(current_profile, config)
+            # Update the current profile's config, reusing the profile data read above
+            return self.update_profile_config(current_profile, config, profile_data)
             
         except (OSError, IOError) as e:
             error_msg = f"Error updating lsfg config: {str(e)}"
@@ -122,29 +216,36 @@ class ConfigurationService(BaseService):
             ConfigurationResponse with success status
         """
         try:
-            profile_data = self._get_profile_data()
+            # Only the TOML config is needed here, read it once for both parsing and the in-place edit
+            content = self._read_config_content()
+            if content is None:
+                # No config yet, skip the DLL detection scan since the path is set right below
+                profile_data = self._default_profile_data(ConfigurationManager.get_defaults())
+            else:
+                profile_data = self._profile_data_from_content(content)
             
             # Update global config (DLL path is global)
             profile_data["global_config"]["dll"] = dll_path
             
             # Also update current profile's config for backward compatibility
             current_profile = profile_data["current_profile"]
-            from .config_schema_generated import DLL
-            profile_data["profiles"][current_profile][DLL] = dll_path
+            current_config = ConfigurationManager.get_profile_config(profile_data, current_profile)
+            current_config[DLL] = dll_path
+            profile_data["profiles"][current_profile] = current_config
             
             # Save to file
-            self._save_profile_data(profile_data)
+            self._save_dll_path(profile_data, dll_path, content)
             
             # Update launch script
             script_result = self.update_lsfg_script_from_profile_data(profile_data)
             if not script_result["success"]:
                 self.log.warning(f"Failed to update launch script: {script_result['error']}")
             
-            self.log.info(f"Updated DLL path in lsfg configuration: '{dll_path}'")
+            self.log.info("Updated DLL path in lsfg configuration: '%s'", dll_path)
             
             return self._success_response(ConfigurationResponse,
                                         f"DLL path updated to: {dll_path}",
-                                        config=profile_data["profiles"][current_profile])
+                                        config=current_config)
             
         except Exception as e:
             error_msg = f"Error updating DLL path: {str(e)}"
@@ -163,10 +264,8 @@ class ConfigurationService(BaseService):
         try:
             script_content = self._generate_script_content(config)
             
-            # Write the script file
-            self._write_file(self.lsfg_script_path, script_content, 0o755)
-            
-            self.log.info(f"Updated lsfg launch script at {self.lsfg_script_path}")
+            if self._write_script(script_content):
+                self.log.info(f"Updated lsfg launch script at {self.lsfg_script_path}")
             
             return self._success_response(ConfigurationResponse,
                                         "Launch script updated successfully",
@@ -177,6 +276,40 @@ class ConfigurationService(BaseService):
             self.log.error(error_msg)
             return self._error_response(ConfigurationResponse, str(e), config=None)
     
+    def _write_script(self, script_content: str) -> bool:
+        """Write the launch script unless it already has this content
+        
+        Most settings only live in the TOML config, so saving them leaves the script unchanged.
+        
+        Args:
+            script_content: Complete script content
+            
+        Returns:
+            True if the script was written, False if it was already up to date
+        """
+        # Most saves leave the script as it was last seen, which only costs a stat to confirm
+        cached = self._script_cache
+        if cached is not None and cached[1] == script_content and \
+                cached[0] == self._file_signature(self.lsfg_script_path):
+            self.log.info(f"Launch script {self.lsfg_script_path} is already up to date")
+            return False
+        
+        try:
+            current_content, stat = self._read_text_file(self.lsfg_script_path)
+            if current_content == script_content:
+                self._script_cache = ((stat.st_mtime_ns, stat.st_size), current_content)
+                self.log.info(f"Launch script {self.lsfg_script_path} is already up to date")
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass  # Missing or unreadable, write it
+        
+        # Replace the script atomically, bash may be reading it for a game launch
+        self._write_file(self.lsfg_script_path, script_content, 0o755, atomic=True)
+        
+        signature = self._file_signature(self.lsfg_script_path)
+        self._script_cache = (signature, script_content) if signature is not None else None
+        return True
+    
     def _generate_script_content(self, config: ConfigurationData) -> str:
         """Generate the content for the ~/lsfg launch script
         
@@ -186,23 +319,8 @@ class ConfigurationService(BaseService):
         Returns:
             The complete script content as a string
         """
-        lines = [
-            "#!/bin/bash",
-            "# lsfg-vk launch script generated by decky-lossless-scaling-vk plugin",
-            "# This script sets up the environment for lsfg-vk to work with the plugin configuration"
-        ]
-        
-        # Use auto-generated script generation logic
-        generate_script_lines = get_script_generation_logic()
-        lines.extend(generate_script_lines(config))
-        
-        # Always add the LSFG_PROCESS export and execution line
-        lines.extend([
-            "export LSFG_PROCESS=decky-lsfg-vk",
-            'exec "$@"'
-        ])
-        
-        return "\n".join(lines) + "\n"
+        # Always export the default profile as LSFG_PROCESS
+        return ConfigurationService._fill_script_template(config, DEFAULT_PROFILE_NAME, "")
     
     def _generate_script_content_for_profile(self, profile_data: ProfileData) -> str:
         """Generate the content for the ~/lsfg launch script with profile support
@@ -214,60 +332,144 @@ class ConfigurationService(BaseService):
             The complete script content as a string
         """
         current_profile = profile_data["current_profile"]
-        config = profile_data["profiles"].get(current_profile, ConfigurationManager.get_defaults())
         
-        # Merge global config with profile config
-        merged_config = dict(config)
-        for field_name, value in profile_data["global_config"].items():
-            merged_config[field_name] = value
-        
-        lines = [
-            "#!/bin/bash",
-            "# lsfg-vk launch script generated by decky-lossless-scaling-vk plugin",
-            f"# Current profile: {current_profile}",
-            "# This script sets up the environment for lsfg-vk to work with the plugin configuration"
-        ]
-        
-        # Use auto-generated script generation logic
-        generate_script_lines = get_script_generation_logic()
-        lines.extend(generate_script_lines(merged_config))
+        # Merge global config with profile config in a single copy
+        profile_config = profile_data["profiles"].get(current_profile, ConfigurationManager.get_defaults_view())
+        merged_config = {**profile_config, **profile_data["global_config"]}
         
         # Export LSFG_PROCESS with current profile name
-        lines.extend([
-            f"export LSFG_PROCESS={current_profile}",
-            'exec "$@"'
-        ])
+        return ConfigurationService._fill_script_template(merged_config, current_profile,
+                                                          f"# Current profile: {current_profile}\n")
+    
+    @staticmethod
+    def _fill_script_template(config: Dict[str, Any], lsfg_process: str, profile_comment: str) -> str:
+        """Fill the launch script template
         
-        return "\n".join(lines) + "\n"
+        Args:
+            config: Configuration data to export to the script environment
+            lsfg_process: Value exported as LSFG_PROCESS
+            profile_comment: Comment line(s) naming the profile, may be empty
+            
+        Returns:
+            The complete script content as a string
+        """
+        export_lines = _generate_script_lines(config)
+        exports = "\n".join(export_lines) + "\n" if export_lines else ""
+        return _SCRIPT_TEMPLATE.format(profile_comment=profile_comment, exports=exports,
+                                       lsfg_process=lsfg_process)
     
     def _get_profile_data(self) -> ProfileData:
         """Get current profile data from config file"""
-        if not self.config_file_path.exists():
+        return self._profile_data_from_content(self._read_config_content())
+    
+    def _read_config_content(self) -> Optional[str]:
+        """Read the config file
+        
+        The content is kept until the file's mtime or size changes, so repeated reads of
+        an unchanged file cost a single stat. Returning the same string object also lets
+        the parse cache find it without rehashing.
+        
+        Returns:
+            The config file content, or None if the file doesn't exist
+        """
+        signature = self._file_signature(self.config_file_path)
+        if signature is None:
+            return None
+        
+        cached = self._content_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        try:
+            content, stat = self._read_text_file(self.config_file_path)
+        except FileNotFoundError:
+            return None
+        self._content_cache = ((stat.st_mtime_ns, stat.st_size), content)
+        return content
+    
+    def _profile_data_from_content(self, content: Optional[str]) -> ProfileData:
+        """Get profile data from config file content
+        
+        Args:
+            content: Config file content, None if the file doesn't exist
+            
+        Returns:
+            Parsed profile data, or the default profile structure if there is no config file
+        """
+        if content is None:
             # Return default profile structure if file doesn't exist
-            from .dll_detection import DllDetectionService
-            dll_service = DllDetectionService(self.log)
-            default_config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
-            return ProfileData(
-                current_profile=DEFAULT_PROFILE_NAME,
-                profiles={DEFAULT_PROFILE_NAME: default_config},
-                global_config={
-                    "dll": default_config.get("dll", ""),
-                    "no_fp16": default_config.get("no_fp16", False)
-                }
-            )
+            return self._default_profile_data(self._get_defaults_with_dll_detection())
         
-        content = self.config_file_path.read_text(encoding='utf-8')
         return ConfigurationManager.parse_toml_content_multi_profile(content)
     
+    @staticmethod
+    def _default_profile_data(default_config: ConfigurationData) -> ProfileData:
+        """Build the profile structure used when there is no config file yet
+        
+        Args:
+            default_config: Configuration for the default profile
+            
+        Returns:
+            Profile data holding just the default profile
+        """
+        return ProfileData(
+            current_profile=DEFAULT_PROFILE_NAME,
+            profiles={DEFAULT_PROFILE_NAME: default_config},
+            global_config={
+                "dll": default_config.get("dll", ""),
+                "no_fp16": default_config.get("no_fp16", False)
+            }
+        )
+    
     def _save_profile_data(self, profile_data: ProfileData) -> None:
-        """Save profile data to config file"""
+        """Save profile data to config file, skipping the write if the file already has this content"""
         toml_content = ConfigurationManager.generate_toml_content_multi_profile(profile_data)
         
+        # The UI often re-submits unchanged settings, the current content is usually cached
+        if toml_content == self._read_config_content():
+            self.log.info(f"Configuration unchanged, not rewriting {self.config_file_path}")
+            return
+        
+        self._write_config_content(toml_content)
+    
+    def _write_config_content(self, content: str) -> None:
+        """Write the config file and remember its content for the next read
+        
+        Args:
+            content: Complete TOML content
+        """
         # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_config_dir()
         
         # Write the updated config directly to preserve inode for file watchers
-        self._write_file(self.config_file_path, toml_content, 0o644)
+        try:
+            self._write_file(self.config_file_path, content, 0o644)
+        except FileNotFoundError:
+            # The config directory was removed after it was created, create it again
+            self._config_dir_ready = False
+            self._ensure_config_dir()
+            self._write_file(self.config_file_path, content, 0o644)
+        
+        signature = self._file_signature(self.config_file_path)
+        if signature is not None:
+            self._content_cache = (signature, content)
+    
+    def _save_dll_path(self, profile_data: ProfileData, dll_path: str, content: Optional[str]) -> None:
+        """Save a DLL path change, only rewriting the dll line when the config file has one
+        
+        Args:
+            profile_data: Profile data with the new DLL path applied
+            dll_path: New DLL path
+            content: Current config file content the profile data was read from, None if missing
+        """
+        # An empty path is left out of the file, regenerate it in that case
+        updated = ConfigurationManager.replace_global_dll(content, dll_path) if content and dll_path else None
+        if updated is None:
+            self._save_profile_data(profile_data)
+        elif updated != content:
+            self._write_config_content(updated)
+        else:
+            self.log.info(f"DLL path unchanged in {self.config_file_path}")
     
     # Profile management methods
     def get_profiles(self) -> ProfilesResponse:
@@ -443,18 +645,21 @@ class ConfigurationService(BaseService):
             self.log.error(error_msg)
             return self._error_response(ProfileResponse, str(e), profile_name=None)
     
-    def update_profile_config(self, profile_name: str, config: ConfigurationData) -> ConfigurationResponse:
+    def update_profile_config(self, profile_name: str, config: ConfigurationData,
+                              profile_data: Optional[ProfileData] = None) -> ConfigurationResponse:
         """Update configuration for a specific profile
         
         Args:
             profile_name: Name of the profile to update
             config: Configuration data to apply
+            profile_data: Profile data already read by the caller, read from the config file if None
             
         Returns:
             ConfigurationResponse with success status
         """
         try:
-            profile_data = self._get_profile_data()
+            if profile_data is None:
+                profile_data = self._get_profile_data()
             
             if profile_name not in profile_data["profiles"]:
                 return self._error_response(ConfigurationResponse, 
@@ -465,9 +670,9 @@ class ConfigurationService(BaseService):
             profile_data["profiles"][profile_name] = config
             
             # Update global config fields if they're in the config
-            for field_name in ["dll", "no_fp16"]:
-                if field_name in config:
-                    profile_data["global_config"][field_name] = config[field_name]
+            profile_data["global_config"].update(
+                {field_name: config[field_name] for field_name in GLOBAL_SECTION_FIELDS & config.keys()}
+            )
             
             # Save to file
             self._save_profile_data(profile_data)
@@ -478,9 +683,10 @@ class ConfigurationService(BaseService):
                 if not script_result["success"]:
                     self.log.warning(f"Failed to update launch script: {script_result['error']}")
             
-            # Log with dynamic field listing
-            field_values = ", ".join(f"{k}={repr(v)}" for k, v in config.items())
-            self.log.info(f"Updated profile '{profile_name}' configuration: {field_values}")
+            # Log with dynamic field listing, only built when it will actually be logged
+            if self.log.isEnabledFor(logging.INFO):
+                field_values = ", ".join(f"{k}={repr(v)}" for k, v in config.items())
+                self.log.info("Updated profile '%s' configuration: %s", profile_name, field_values)
             
             return self._success_response(ConfigurationResponse,
                                         f"Profile '{profile_name}' configuration updated successfully",
@@ -503,13 +709,12 @@ class ConfigurationService(BaseService):
         try:
             script_content = self._generate_script_content_for_profile(profile_data)
             
-            # Write the script file
-            self._write_file(self.lsfg_script_path, script_content, 0o755)
-            
-            self.log.info(f"Updated lsfg launch script at {self.lsfg_script_path} for profile '{profile_data['current_profile']}'")
+            if self._write_script(script_content):
+                self.log.info("Updated lsfg launch script at %s for profile '%s'",
+                              self.lsfg_script_path, profile_data["current_profile"])
             
             # Get current profile config for response
-            current_config = profile_data["profiles"].get(profile_data["current_profile"], ConfigurationManager.get_defaults())
+            current_config = ConfigurationManager.get_profile_config(profile_data, profile_data["current_profile"])
             
             return self._success_response(ConfigurationResponse,
                                         "Launch script updated successfully",
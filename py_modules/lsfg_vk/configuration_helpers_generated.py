@@ -9,7 +9,7 @@ from .config_schema_generated import ConfigurationData, ALL_FIELDS
 
 def log_configuration_update(logger, config: ConfigurationData) -> None:
     """Log configuration update with all field values"""
-    logger.info(f"Updated lsfg TOML configuration: dll={config['dll']}, no_fp16={config['no_fp16']}, multiplier={config['multiplier']}, flow_scale={config['flow_scale']}, performance_mode={config['performance_mode']}, hdr_mode={config['hdr_mode']}, experimental_present_mode={config['experimental_present_mode']}, dxvk_frame_rate={config['dxvk_frame_rate']}, enable_wow64={config['enable_wow64']}, disable_steamdeck_mode={config['disable_steamdeck_mode']}, mangohud_workaround={config['mangohud_workaround']}, disable_vkbasalt={config['disable_vkbasalt']}, force_enable_vkbasalt={config['force_enable_vkbasalt']}, enable_wsi={config['enable_wsi']}")
+    logger.info("Updated lsfg TOML configuration: dll=%s, no_fp16=%s, multiplier=%s, flow_scale=%s, performance_mode=%s, hdr_mode=%s, experimental_present_mode=%s, dxvk_frame_rate=%s, enable_wow64=%s, disable_steamdeck_mode=%s, mangohud_workaround=%s, disable_vkbasalt=%s, force_enable_vkbasalt=%s, enable_wsi=%s", config['dll'], config['no_fp16'], config['multiplier'], config['flow_scale'], config['performance_mode'], config['hdr_mode'], config['experimental_present_mode'], config['dxvk_frame_rate'], config['enable_wow64'], config['disable_steamdeck_mode'], config['mangohud_workaround'], config['disable_vkbasalt'], config['force_enable_vkbasalt'], config['enable_wsi'])
 
 
 def get_config_field_names() -> list[str]:
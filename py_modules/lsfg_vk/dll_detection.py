@@ -5,7 +5,7 @@ DLL detection service for Lossless Scaling.
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, cast
 
 from .base_service import BaseService
 from .constants import (
@@ -14,10 +14,24 @@ from .constants import (
 )
 from .types import DllDetectionResponse
 
+# "path" entries in libraryfolders.vdf, typically: "path"		"/path/to/library"
+_VDF_PATH_RE = re.compile(r'"path"\s*"([^"]+)"', re.IGNORECASE)
+
 
 class DllDetectionService(BaseService):
     """Service for detecting Lossless Scaling DLL"""
     
+    def __init__(self, logger: Optional[Any] = None):
+        """Initialize DLL detection service
+        
+        Args:
+            logger: Logger instance, defaults to decky.logger if None
+        """
+        super().__init__(logger)
+        
+        # Last successful detection, keyed by the LSFG_DLL_PATH value it was made with
+        self._last_detected: Optional[Tuple[Optional[str], DllDetectionResponse]] = None
+    
     def check_lossless_scaling_dll(self) -> DllDetectionResponse:
         """Check if Lossless Scaling DLL is available at the expected paths
         
@@ -27,38 +41,22 @@ class DllDetectionService(BaseService):
         3. HOME/.local/share Steam directory  
         4. All Steam library folders (including SD cards)
         
+        A found DLL is remembered and returned again while it still exists, so repeated
+        checks don't rescan the Steam libraries. A failed detection is never reused.
+        
         Returns:
             DllDetectionResponse with detection status and path information
         """
         try:
-            # Check environment variable first
-            dll_path = self._check_env_dll_path()
-            if dll_path:
-                return dll_path
-            
-            # Check XDG_DATA_HOME path
-            xdg_path = self._check_xdg_data_home()
-            if xdg_path:
-                return xdg_path
-            
-            # Check HOME/.local/share path
-            home_path = self._check_home_local_share()
-            if home_path:
-                return home_path
-            
-            # Check all Steam library folders (including SD cards)
-            steam_libraries_path = self._check_steam_library_folders()
-            if steam_libraries_path:
-                return steam_libraries_path
+            env_dll_path = os.getenv(ENV_LSFG_DLL_PATH)
+            if self._last_detected is not None:
+                cached_env, cached = self._last_detected
+                if cached_env == env_dll_path and Path(cached["path"]).exists():
+                    return cast(DllDetectionResponse, dict(cached))
             
-            # DLL not found in any expected location
-            return {
-                "detected": False,
-                "path": None,
-                "source": None,
-                "message": "Lossless Scaling DLL not found in expected locations",
-                "error": None
-            }
+            result = self._detect_dll()
+            self._last_detected = (env_dll_path, result) if result["detected"] else None
+            return cast(DllDetectionResponse, dict(result))
             
         except Exception as e:
             error_msg = f"Error checking Lossless Scaling DLL: {str(e)}"
@@ -71,6 +69,41 @@ class DllDetectionService(BaseService):
                 "error": str(e)
             }
     
+    def _detect_dll(self) -> DllDetectionResponse:
+        """Search the expected locations for the DLL, in the order described above
+        
+        Returns:
+            DllDetectionResponse with detection status and path information
+        """
+        # Check environment variable first
+        dll_path = self._check_env_dll_path()
+        if dll_path:
+            return dll_path
+        
+        # Check XDG_DATA_HOME path
+        xdg_path = self._check_xdg_data_home()
+        if xdg_path:
+            return xdg_path
+        
+        # Check HOME/.local/share path
+        home_path = self._check_home_local_share()
+        if home_path:
+            return home_path
+        
+        # Check all Steam library folders (including SD cards)
+        steam_libraries_path = self._check_steam_library_folders()
+        if steam_libraries_path:
+            return steam_libraries_path
+        
+        # DLL not found in any expected location
+        return {
+            "detected": False,
+            "path": None,
+            "source": None,
+            "message": "Lossless Scaling DLL not found in expected locations",
+            "error": None
+        }
+    
     def _check_env_dll_path(self) -> DllDetectionResponse | None:
         """Check LSFG_DLL_PATH environment variable
         
@@ -142,7 +175,12 @@ class DllDetectionService(BaseService):
         """
         steam_libraries = self._get_steam_library_paths()
         
+        # The main Steam directories were already checked by the XDG_DATA_HOME and HOME steps
+        already_checked = {str(steam_path) for steam_path in self._get_steam_install_paths()}
+        
         for library_path in steam_libraries:
+            if library_path in already_checked:
+                continue
             dll_path = Path(library_path) / STEAM_COMMON_PATH / LOSSLESS_DLL_NAME
             if dll_path.exists():
                 self.log.info(f"Found DLL in Steam library: {dll_path}")
@@ -156,15 +194,12 @@ class DllDetectionService(BaseService):
         
         return None
     
-    def _get_steam_library_paths(self) -> List[str]:
-        """Get all Steam library folder paths from libraryfolders.vdf
+    def _get_steam_install_paths(self) -> List[Path]:
+        """Get the possible Steam installation directories
         
         Returns:
-            List of Steam library folder paths
+            List of Steam directory paths, XDG_DATA_HOME first
         """
-        library_paths = []
-        
-        # Try different possible Steam installation locations
         steam_paths = []
         
         # XDG_DATA_HOME path
@@ -177,19 +212,28 @@ class DllDetectionService(BaseService):
         if home_dir and home_dir.strip():
             steam_paths.append(Path(home_dir.strip()) / ".local" / "share" / "Steam")
         
-        for steam_path in steam_paths:
+        return steam_paths
+    
+    def _get_steam_library_paths(self) -> List[str]:
+        """Get all Steam library folder paths from libraryfolders.vdf
+        
+        Returns:
+            List of Steam library folder paths
+        """
+        library_paths = []
+        
+        for steam_path in self._get_steam_install_paths():
             if steam_path.exists():
                 # Add the main Steam directory as a library
                 library_paths.append(str(steam_path))
                 
                 # Parse libraryfolders.vdf for additional libraries
                 vdf_path = steam_path / "steamapps" / "libraryfolders.vdf"
-                if vdf_path.exists():
-                    try:
-                        additional_paths = self._parse_library_folders_vdf(vdf_path)
-                        library_paths.extend(additional_paths)
-                    except Exception as e:
-                        self.log.warning(f"Failed to parse {vdf_path}: {str(e)}")
+                try:
+                    additional_paths = self._parse_library_folders_vdf(vdf_path)
+                    library_paths.extend(additional_paths)
+                except Exception as e:
+                    self.log.warning(f"Failed to parse {vdf_path}: {str(e)}")
         
         # Remove duplicates while preserving order
         seen = set()
@@ -218,20 +262,22 @@ class DllDetectionService(BaseService):
                 content = f.read()
             
             # Look for "path" entries in the VDF file
-            # The format is typically: "path"		"/path/to/library"
-            path_pattern = r'"path"\s*"([^"]+)"'
-            matches = re.findall(path_pattern, content, re.IGNORECASE)
+            matches = _VDF_PATH_RE.findall(content)
             
-            for path_match in matches:
+            # Each library is only checked once, even if it's listed more than once
+            for path_match in dict.fromkeys(matches):
                 # Convert Windows paths to Unix paths if needed
                 path = path_match.replace('\\\\', '/').replace('\\', '/')
                 library_path = Path(path)
                 
-                # Verify the library folder exists and has a steamapps directory
-                if library_path.exists() and (library_path / "steamapps").exists():
+                # Verify the library folder has a steamapps directory (which implies the folder exists)
+                if (library_path / "steamapps").exists():
                     library_paths.append(str(library_path))
                     self.log.info(f"Found additional Steam library: {library_path}")
         
+        except FileNotFoundError:
+            # No libraryfolders.vdf means there are no additional libraries
+            pass
         except Exception as e:
             self.log.error(f"Error parsing libraryfolders.vdf: {str(e)}")
         
@@ -15,7 +15,10 @@ from .constants import (
     LIB_FILENAME, JSON_FILENAME, ZIP_FILENAME, BIN_DIR,
     SO_EXT, JSON_EXT
 )
-from .config_schema import ConfigurationManager
+from .config_schema import ConfigurationManager, ProfileData
+from .config_schema_generated import DLL
+from .configuration import ConfigurationService
+from .dll_detection import DllDetectionService
 from .types import InstallationResponse, UninstallationResponse, InstallationCheckResponse
 
 
@@ -145,17 +148,22 @@ class InstallationService(BaseService):
         
         If a config file already exists, preserve existing profiles and only update global settings like DLL path.
         """
-        # Import here to avoid circular imports
-        from .dll_detection import DllDetectionService
-        
         # Try to detect DLL path
         dll_service = DllDetectionService(self.log)
         
         # Check if config file already exists
-        if self.config_file_path.exists():
+        try:
+            content, _ = self._read_text_file(self.config_file_path)
+        except FileNotFoundError:
+            content = None
+        except (OSError, UnicodeDecodeError) as e:
+            # Unreadable or not UTF-8, replace it like a config file that fails to parse
+            self.log.warning(f"Failed to read existing config file: {str(e)}, creating new one")
+            content = None
+        
+        if content is not None:
             try:
                 # Read existing config to preserve user profiles
-                content = self.config_file_path.read_text(encoding='utf-8')
                 existing_profile_data = ConfigurationManager.parse_toml_content_multi_profile(content)
                 self.log.info(f"Found existing config file, preserving user profiles")
                 
@@ -181,7 +189,6 @@ class InstallationService(BaseService):
         self.log.info(f"Created config file at {self.config_file_path}")
         
         # Log detected DLL path if found - USE GENERATED CONSTANTS
-        from .config_schema_generated import DLL
         try:
             # Try to parse the written content to get the DLL path
             final_content = self.config_file_path.read_text(encoding='utf-8')
@@ -194,11 +201,9 @@ class InstallationService(BaseService):
     def _create_lsfg_launch_script(self) -> None:
         """Create the ~/lsfg launch script for easier game setup"""
         # Use the default configuration for the initial script
-        from .config_schema import ConfigurationManager
-        default_config = ConfigurationManager.get_defaults()
+        default_config = ConfigurationManager.get_defaults_view()
         
         # Create configuration service to generate the script
-        from .configuration import ConfigurationService
         config_service = ConfigurationService(logger=self.log)
         config_service.user_home = self.user_home
         config_service.lsfg_script_path = self.lsfg_launch_script_path
@@ -207,7 +212,7 @@ class InstallationService(BaseService):
         script_content = config_service._generate_script_content(default_config)
         
         # Write the script file
-        self._write_file(self.lsfg_launch_script_path, script_content, 0o755)
+        self._write_file(self.lsfg_launch_script_path, script_content, 0o755, atomic=True)
         self.log.info(f"Created lsfg launch script at {self.lsfg_launch_script_path}")
     
     def check_installation(self) -> InstallationCheckResponse:
@@ -338,8 +343,6 @@ class InstallationService(BaseService):
         Returns:
             ProfileData with merged configuration
         """
-        from .config_schema import ProfileData
-        
         # Get current schema defaults
         default_config = ConfigurationManager.get_defaults_with_dll_detection(dll_service)
         default_global_config = {
@@ -7,7 +7,6 @@ Vulkan layer for Lossless Scaling frame generation on Steam Deck.
 
 import os
 import json
-import subprocess
 import urllib.request
 import ssl
 import hashlib
@@ -19,6 +18,9 @@ from .dll_detection import DllDetectionService
 from .configuration import ConfigurationService
 from .config_schema import ConfigurationManager
 
+# GitHub releases endpoint used by the self-updater
+RELEASES_API_URL = "https://api.github.com/repos/xXJSONDeruloXx/decky-lossless-scaling-vk/releases"
+
 
 class Plugin:
     """
@@ -329,44 +331,18 @@ class Plugin:
             package_json_path = Path(decky.DECKY_PLUGIN_DIR) / "package.json"
             current_version = "0.0.0"
             
-            if package_json_path.exists():
-                try:
-                    with open(package_json_path, 'r', encoding='utf-8') as f:
-                        package_data = json.load(f)
-                        current_version = package_data.get('version', '0.0.0')
-                except Exception as e:
-                    decky.logger.warning(f"Failed to read package.json: {e}")
-            
-            # Fetch most recent release from GitHub (including pre-releases)
-            api_url = "https://api.github.com/repos/xXJSONDeruloXx/decky-lossless-scaling-vk/releases"
+            try:
+                with open(package_json_path, 'r', encoding='utf-8') as f:
+                    package_data = json.load(f)
+                    current_version = package_data.get('version', '0.0.0')
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                decky.logger.warning(f"Failed to read package.json: {e}")
             
             try:
-                # Create SSL context that doesn't verify certificates
-                # This is needed on Steam Deck where certificate verification often fails
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                # Use urllib to fetch all releases (sorted by most recent first)
-                with urllib.request.urlopen(api_url, context=ssl_context) as response:
-                    releases_data = json.loads(response.read().decode('utf-8'))
-                
-                # Get the most recent release (first item in the array)
-                if not releases_data:
-                    raise Exception("No releases found")
-                    
-                release_data = releases_data[0]
-                
-                latest_version = release_data.get('tag_name', '').lstrip('v')
-                release_notes = release_data.get('body', '')
-                release_date = release_data.get('published_at', '')
-                
-                # Find the plugin zip download URL
-                download_url = ""
-                for asset in release_data.get('assets', []):
-                    if asset.get('name', '').endswith('.zip'):
-                        download_url = asset.get('browser_download_url', '')
-                        break
+                release = self._get_latest_release()
+                latest_version = release["latest_version"]
                 
                 # Compare versions
                 update_available = self._compare_versions(current_version, latest_version)
@@ -375,10 +351,7 @@ class Plugin:
                     "success": True,
                     "update_available": update_available,
                     "current_version": current_version,
-                    "latest_version": latest_version,
-                    "release_notes": release_notes,
-                    "release_date": release_date,
-                    "download_url": download_url
+                    **release
                 }
                 
             except Exception as e:
@@ -394,6 +367,45 @@ class Plugin:
                 "error": f"Update check failed: {str(e)}"
             }
 
+    def _get_latest_release(self) -> Dict[str, str]:
+        """Get the most recent GitHub release (including pre-releases)
+        
+        Returns:
+            Dict with latest_version, release_notes, release_date and download_url
+            
+        Raises:
+            Exception: If the releases can't be fetched or there are none
+        """
+        # Create SSL context that doesn't verify certificates
+        # This is needed on Steam Deck where certificate verification often fails
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        
+        # Use urllib to fetch all releases (sorted by most recent first)
+        with urllib.request.urlopen(RELEASES_API_URL, context=ssl_context) as response:
+            releases_data = json.loads(response.read().decode('utf-8'))
+        
+        # Get the most recent release (first item in the array)
+        if not releases_data:
+            raise Exception("No releases found")
+            
+        release_data = releases_data[0]
+        
+        # Find the plugin zip download URL
+        download_url = ""
+        for asset in release_data.get('assets', []):
+            if asset.get('name', '').endswith('.zip'):
+                download_url = asset.get('browser_download_url', '')
+                break
+        
+        return {
+            "latest_version": release_data.get('tag_name', '').lstrip('v'),
+            "release_notes": release_data.get('body', ''),
+            "release_date": release_data.get('published_at', ''),
+            "download_url": download_url
+        }
+
     async def download_plugin_update(self, download_url: str) -> Dict[str, Any]:
         """Download the plugin update zip file to ~/Downloads
         
@@ -417,8 +429,7 @@ class Plugin:
             download_path = downloads_dir / "decky-lossless-scaling-vk.zip"
             
             # Remove existing file if it exists
-            if download_path.exists():
-                download_path.unlink()
+            download_path.unlink(missing_ok=True)
             
             # Download the file
             decky.logger.info(f"Downloading plugin update from {download_url}")
@@ -529,15 +540,15 @@ class Plugin:
         """
         try:
             config_path = self.configuration_service.config_file_path
-            if not config_path.exists():
+            try:
+                content = config_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 return {
                     "success": False,
                     "content": None,
                     "path": str(config_path),
                     "error": "Config file does not exist"
                 }
-            
-            content = config_path.read_text(encoding='utf-8')
             return {
                 "success": True,
                 "content": content,
@@ -560,15 +571,15 @@ class Plugin:
         """
         try:
             script_path = self.installation_service.lsfg_script_path
-            if not script_path.exists():
+            try:
+                content = script_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 return {
                     "success": False,
                     "content": None,
                     "path": str(script_path),
                     "error": "Launch script does not exist"
                 }
-            
-            content = script_path.read_text(encoding='utf-8')
             return {
                 "success": True,
                 "content": content,
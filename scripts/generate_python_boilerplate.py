@@ -88,15 +88,18 @@ def generate_config_dict_creation() -> str:
 
 
 def generate_script_parsing() -> str:
-    """Generate script content parsing logic"""
-    lines = []
-    
+    """Generate script content parsing table (per-variable dispatch for the export scanner)"""
     script_fields = [
         (field_name, field_def) 
         for field_name, field_def in CONFIG_SCHEMA_DEF.items()
         if field_def.get("location") == "script"
     ]
     
+    lines = [
+        "# Launch script parsing: `export KEY=VALUE` lines are dispatched per variable",
+        "_SCRIPT_DISPATCH = {",
+    ]
+    
     for field_name, field_def in script_fields:
         env_var = get_env_var_name(field_name)
         field_type = ConfigFieldType(field_def["fieldType"])
@@ -104,31 +107,21 @@ def generate_script_parsing() -> str:
         if field_type == ConfigFieldType.BOOLEAN:
             if field_name == "disable_steamdeck_mode":
                 # Special case: SteamDeck=0 means disable_steamdeck_mode=True
-                lines.append(f'                    elif key == "{env_var}":')
-                lines.append(f'                        script_values["{field_name}"] = value == "0"')
+                convert = 'lambda value: value == "0"'
             elif field_name == "enable_wsi":
                 # Special case: ENABLE_GAMESCOPE_WSI=0 means enable_wsi=False
-                lines.append(f'                    elif key == "{env_var}":')
-                lines.append(f'                        script_values["{field_name}"] = value != "0"')
+                convert = 'lambda value: value != "0"'
             else:
-                lines.append(f'                    elif key == "{env_var}":')
-                lines.append(f'                        script_values["{field_name}"] = value == "1"')
+                convert = 'lambda value: value == "1"'
         elif field_type == ConfigFieldType.INTEGER:
-            lines.append(f'                    elif key == "{env_var}":')
-            lines.append('                        try:')
-            lines.append(f'                            script_values["{field_name}"] = int(value)')
-            lines.append('                        except ValueError:')
-            lines.append('                            pass')
+            convert = "int"
         elif field_type == ConfigFieldType.FLOAT:
-            lines.append(f'                    elif key == "{env_var}":')
-            lines.append('                        try:')
-            lines.append(f'                            script_values["{field_name}"] = float(value)')
-            lines.append('                        except ValueError:')
-            lines.append('                            pass')
-        elif field_type == ConfigFieldType.STRING:
-            lines.append(f'                    elif key == "{env_var}":')
-            lines.append(f'                        script_values["{field_name}"] = value')
+            convert = "float"
+        else:
+            convert = "str"
+        lines.append(f'    "{env_var}": ("{field_name}", {convert}),')
     
+    lines.append("}")
     return "\n".join(lines)
 
 
@@ -179,13 +172,9 @@ def generate_script_generation() -> str:
 
 def generate_log_statement() -> str:
     """Generate logging statement with all field values"""
-    field_parts = []
-    
-    for field_name in CONFIG_SCHEMA_DEF.keys():
-        field_parts.append(f"{field_name}={{{field_name}}}")
-    
-    log_format = ", ".join(field_parts)
-    return f'            self.log.info(f"Updated lsfg TOML configuration: {log_format}")'
+    log_format = ", ".join(f"{field_name}=%s" for field_name in CONFIG_SCHEMA_DEF.keys())
+    log_args = ", ".join(CONFIG_SCHEMA_DEF.keys())
+    return f'            self.log.info("Updated lsfg TOML configuration: {log_format}", {log_args})'
 
 
 def generate_complete_schema_file() -> str:
@@ -219,23 +208,27 @@ def generate_complete_schema_file() -> str:
         generate_typed_dict(),
         '',
         '',
+        generate_script_parsing(),
+        '',
+        '',
         'def get_script_parsing_logic():',
         '    """Return the script parsing logic as a callable"""',
-        '    def parse_script_values(lines):', 
+        '    def parse_script_values(script_content):',
         '        script_values = {}',
-        '        for line in lines:',
-        '            line = line.strip()',
-        '            if not line or line.startswith("#") or not line.startswith("export "):',
+        '        for line in script_content.split("\\n"):',
+        '            line = line.lstrip(" \\t")',
+        '            # "export" followed by at least one space or tab',
+        '            if not line.startswith("export") or line[6:7] not in (" ", "\\t"):',
         '                continue',
-        '            if "=" in line:',
-        '                export_line = line[len("export "):]', 
-        '                key, value = export_line.split("=", 1)',
-        '                key = key.strip()',
-        '                value = value.strip()',
-        '',
-        '                # Auto-generated parsing logic:',
-        f'{generate_script_parsing().replace("                    elif", "                if")}',
-        '',
+        '            key, sep, value = line[7:].partition("=")',
+        '            entry = _SCRIPT_DISPATCH.get(key.strip(" \\t"))',
+        '            if entry is None or not sep:',
+        '                continue',
+        '            field_name, convert = entry',
+        '            try:',
+        '                script_values[field_name] = convert(value.lstrip(" \\t").rstrip(" \\t\\r"))',
+        '            except ValueError:',
+        '                pass',
         '        return script_values',
         '    return parse_script_values',
         '',
@@ -272,11 +265,10 @@ def generate_complete_schema_file() -> str:
 def generate_complete_configuration_helpers() -> str:
     """Generate configuration_helpers_generated.py file"""
     
-    # Generate the log format string using config parameter
-    log_parts = []
-    for field_name in CONFIG_SCHEMA_DEF.keys():
-        log_parts.append(f"{field_name}={{config['{field_name}']}}")
-    log_format = ", ".join(log_parts)
+    # Generate a lazy %-style log format string and its config arguments, so the
+    # message is only formatted when INFO records are actually emitted
+    log_format = ", ".join(f"{field_name}=%s" for field_name in CONFIG_SCHEMA_DEF.keys())
+    log_args = ", ".join(f"config['{field_name}']" for field_name in CONFIG_SCHEMA_DEF.keys())
     
     lines = [
         '"""',
@@ -290,7 +282,7 @@ def generate_complete_configuration_helpers() -> str:
         '',
         'def log_configuration_update(logger, config: ConfigurationData) -> None:',
         '    """Log configuration update with all field values"""',
-        f'    logger.info(f"Updated lsfg TOML configuration: {log_format}")',
+        f'    logger.info("Updated lsfg TOML configuration: {log_format}", {log_args})',
         '',
         '',
         'def get_config_field_names() -> list[str]:',